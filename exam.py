@@ -9,11 +9,43 @@ and provides feedback on the user's answers.
 """
 import os
 import re
+import sys
 import random
-import tkinter as tk
-import argparse
-from tkinter import ttk, messagebox
-from collections import defaultdict
+import pickle
+from array import array
+
+# Tkinter is imported lazily by load_tkinter() so that importing this
+# module or printing --help doesn't pay for Tcl/Tk interpreter startup
+tk = None
+ttk = None
+messagebox = None
+
+
+def load_tkinter():
+    """Import Tkinter on first use; only the GUI paths need it."""
+    global tk, ttk, messagebox
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as ttk_module
+        from tkinter import messagebox as messagebox_module
+
+        tk = tkinter
+        ttk = ttk_module
+        messagebox = messagebox_module
+
+# Bump when the parsed question format changes so stale caches are discarded
+CACHE_VERSION = 2
+
+# Precompiled patterns for parsing question blocks out of the markdown file
+_QUESTION_RE = re.compile(r"\d+\.\s+(.*)")
+_OPTION_LINE_RE = re.compile(r"^\s*\d+\.\s+")
+_SECTION_RE = re.compile(r"^#+\s+(.+)$")
+_VALID_RE = re.compile(r"<!--\s*valid:\s*(\d+)\s*-->")
+
+# Precompiled patterns for cleaning question text
+_COMMENT_RE = re.compile(r"<!--.*?-->")
+_WS_RE = re.compile(r"\s+")
+_PUNCT_TABLE = str.maketrans("", "", ".,;:()")
 
 # Light mode colors
 LIGHT_FOREGROUND_COLOR = "#333333"
@@ -28,18 +60,49 @@ DARK_SUCCESS_COLOR = "#00C853"
 DARK_ERROR_COLOR = "#D50000"
 
 
+class Question:
+    """A single parsed exam question, stored compactly via __slots__."""
+
+    __slots__ = (
+        "question",
+        "clean_question",
+        "options",
+        "correct_answer",
+        "valid_answers",
+        "is_ai",
+        "source_exam",
+        "key",
+        "duplicate_count",
+        "duplicate_sources",
+    )
+
+    def __init__(self, question, options, valid_answers, is_ai, source_exam):
+        self.question = question
+        # Strip markdown comments once here rather than on every display
+        self.clean_question = _COMMENT_RE.sub("", question).strip()
+        self.options = options
+        self.correct_answer = 0
+        self.valid_answers = valid_answers
+        self.is_ai = is_ai
+        self.source_exam = source_exam
+        self.key = None
+        self.duplicate_count = 1
+        self.duplicate_sources = [source_exam]
+
+
 class ExamSimulator:
     """Simulates a quiz application using a Tkinter GUI."""
 
     def __init__(self, root, exam_file=None):
+        load_tkinter()
         self.root = root
         self.exam_file = exam_file
 
         # Set window title based on exam file
         if exam_file:
-            if os.path.dirname(os.path.abspath(exam_file)) == os.path.abspath(
-                os.getcwd()
-            ):
+            # getcwd() is already absolute; normalize the exam path once
+            abs_exam = os.path.abspath(exam_file)
+            if os.path.dirname(abs_exam) == os.getcwd():
                 self.root.title(f"Exam Simulator - {os.path.basename(exam_file)}")
             else:
                 self.root.title(
@@ -66,6 +129,7 @@ class ExamSimulator:
             except tk.TclError:
                 pass  # Fallback to geometry setting above
         self.result_shown = False
+        self.resize_after_id = None
 
         # Store window dimensions
         self.window_width = screen_width
@@ -82,6 +146,14 @@ class ExamSimulator:
         self.questions = []
         self.unique_questions = []
         self.question_order = []
+        self.current_question = None
+        self.valid_display_flags = []
+        self.is_ai_flags = array("b")
+        self.all_indices = []
+        self.non_ai_indices = []
+        self.option_orders = {}
+        self.total_count = 0
+        self.non_ai_total = 0
         self.current_question_index = 0
         self.selected_answer = tk.StringVar()
         self.score = 0
@@ -114,7 +186,9 @@ class ExamSimulator:
 
     def apply_theme(self):
         """Apply the current theme (dark or light mode) to the UI."""
-        colors = self.get_current_colors()
+        # Resolve the palette once per theme change; hot paths read the
+        # cached dict instead of rebuilding it
+        colors = self.colors = self.get_current_colors()
 
         self.root.configure(bg=colors["bg"])
 
@@ -156,15 +230,39 @@ class ExamSimulator:
 
     def toggle_theme(self):
         """Toggle between dark and light mode."""
-        self.dark_mode = self.dark_mode_var.get()
+        new_mode = self.dark_mode_var.get()
+        if new_mode == self.dark_mode:
+            return
+        self.dark_mode = new_mode
         self.apply_theme()
-
-        if (
-            hasattr(self, "questions")
-            and self.questions
-            and hasattr(self, "answer_widgets")
-        ):
-            self.show_question()
+        self.retint_answer_rows()
+
+    def retint_answer_rows(self):
+        """Recolor the pooled answer rows for the current theme.
+
+        Retinting in place keeps the quiz state (selection, shown result)
+        that a full show_question rebuild would throw away.
+        """
+        colors = self.colors
+        bg = colors["bg"]
+        fg = colors["fg"]
+        for frame, radio, icon_label in getattr(self, "row_pool", []):
+            frame.config(bg=bg)
+            radio.config(
+                bg=bg,
+                fg=fg,
+                selectcolor=fg,
+                activebackground=bg,
+                activeforeground=fg,
+            )
+            if icon_label is not None:
+                icon_text = icon_label.cget("text")
+                if icon_text == "✓":
+                    icon_label.config(bg=bg, fg=colors["success"])
+                elif icon_text == "×":
+                    icon_label.config(bg=bg, fg=colors["error"])
+                else:
+                    icon_label.config(bg=bg)
 
     def setup_ui(self):
         """Set up the main user interface components and layout."""
@@ -190,6 +288,14 @@ class ExamSimulator:
         self.answer_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=5)
         self.answer_frame.grid_columnconfigure(0, weight=1)
 
+        self.options_frame = ttk.Frame(self.answer_frame)
+        self.options_frame.pack(fill=tk.BOTH, expand=True, anchor="w")
+        self.options_frame.columnconfigure(0, weight=1)
+
+        # Reusable answer rows; grown on demand and reconfigured per
+        # question instead of destroying and recreating the widgets
+        self.row_pool = []
+
         # Control buttons and checkboxes
         self.controls_frame = ttk.Frame(self.main_frame)
         self.controls_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=5)
@@ -251,16 +357,102 @@ class ExamSimulator:
         self.status_label = ttk.Label(self.main_frame, text="")
         self.status_label.grid(row=3, column=0, sticky="ew", padx=10, pady=5)
 
+    def create_answer_row(self, row_index):
+        """Create one reusable answer row (frame, radio button, icon label)."""
+        colors = self.colors
+
+        frame = tk.Frame(self.options_frame, bg=colors["bg"])
+        frame.grid(row=row_index, column=0, sticky="ew", pady=5)
+        frame.grid_columnconfigure(0, weight=1)
+
+        radio = tk.Radiobutton(
+            frame,
+            text="",
+            variable=self.selected_answer,
+            value=str(row_index),
+            command=self.on_radio_selected,
+            wraplength=self.window_width - 240,
+            anchor="nw",
+            justify="left",
+            bg=colors["bg"],
+            fg=colors["fg"],
+            selectcolor=colors["fg"],
+            font=("Arial", 12),
+            highlightthickness=0,
+            bd=0,
+            activebackground=colors["bg"],
+            activeforeground=colors["fg"],
+        )
+        radio.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
+
+        # The correct/incorrect icon label is created lazily by
+        # ensure_icon_label; most rows never need to show one
+        return [frame, radio, None]
+
+    def ensure_icon_label(self, row_index):
+        """Return the row's status icon label, creating it on first use."""
+        row = self.row_pool[row_index]
+        if row[2] is None:
+            colors = self.colors
+            icon_label = tk.Label(
+                row[0],
+                text="",
+                bg=colors["bg"],
+                font=("Arial", 32),
+                width=2,
+                anchor="n",
+            )
+            icon_label.grid(row=0, column=1, sticky="ne", padx=(0, 10), pady=10)
+            row[2] = icon_label
+        return row[2]
+
     def compute_question_key(self, question):
         """Compute a unique key for a question to identify duplicates."""
         # Clean question text for comparison
-        question_text = re.sub(r"<!--.*?-->", "", question["question"].lower().strip())
+        question_text = _COMMENT_RE.sub("", question.question.lower().strip())
 
-        question_text = re.sub(r"[.,;:()]", "", question_text)
-        question_text = re.sub(r"\s+", " ", question_text)
+        question_text = question_text.translate(_PUNCT_TABLE)
+        question_text = _WS_RE.sub(" ", question_text)
 
         return question_text
 
+    def read_question_cache(self, cache_path, file_stat):
+        """Return cached parsed questions if still valid, otherwise None."""
+        # A corrupt cache can raise almost anything out of pickle
+        # (OverflowError, ValueError, ...); any failure here just means
+        # we fall back to parsing, so catch broadly
+        try:
+            with open(cache_path, "rb") as cache_file:
+                payload = pickle.load(cache_file)
+            if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+                return None
+            if payload.get("fingerprint") != (
+                file_stat.st_mtime_ns,
+                file_stat.st_size,
+            ):
+                return None
+            questions = payload.get("questions")
+            unique_questions = payload.get("unique_questions")
+        except Exception:
+            return None
+        if questions is None or unique_questions is None:
+            return None
+        return questions, unique_questions
+
+    def write_question_cache(self, cache_path, file_stat):
+        """Persist the parsed questions so unchanged files skip re-parsing."""
+        payload = {
+            "version": CACHE_VERSION,
+            "fingerprint": (file_stat.st_mtime_ns, file_stat.st_size),
+            "questions": self.questions,
+            "unique_questions": self.unique_questions,
+        }
+        try:
+            with open(cache_path, "wb") as cache_file:
+                pickle.dump(payload, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # A read-only location just means no cache next launch
+
     def load_questions(self):
         """Load and parse questions from the markdown file and identify duplicates."""
         if not self.exam_file:
@@ -271,47 +463,101 @@ class ExamSimulator:
             messagebox.showerror("Error", f"Exam file not found at {self.exam_file}")
             return
 
-        with open(self.exam_file, "r", encoding="utf-8") as file:
-            content = file.read()
+        # Reuse the parse cache when the exam file hasn't changed since
+        # the last launch; mtime+size is the invalidation fingerprint
+        file_stat = os.stat(self.exam_file)
+        cache_path = self.exam_file + ".cache.pkl"
+        cached = self.read_question_cache(cache_path, file_stat)
+        if cached is not None:
+            self.questions, self.unique_questions = cached
+        else:
+            self.parse_exam_file()
+            if self.questions:
+                self.write_question_cache(cache_path, file_stat)
 
-        # Parse question blocks from markdown
-        pattern = r"(\d+\.\s+.*?)(?=\n\d+\.\s+|\n##|\n### |\Z)"
-        question_blocks = re.findall(pattern, content, re.DOTALL)
+        # Validate loaded questions
+        if not self.questions:
+            messagebox.showerror(
+                "Error",
+                f"No valid questions found in {self.exam_file}. Please check the file format.",
+            )
+            return
+
+        self.finish_loading()
 
-        # Track exam sections
+    def parse_exam_file(self):
+        """Parse question blocks out of the markdown exam file."""
+        # Stream the file through a single linear scan: a top-level numbered
+        # line starts a block, a heading or the next question ends it.
+        # Each block carries the section in effect where it started, so no
+        # separate section lookup is needed later.
         current_section = "Unknown Exam"
-        section_pattern = r"^#+\s+(.+)$"
-        sections = {}
-        line_number = 0
-
-        for line in content.split("\n"):
-            line_number += 1
-            section_match = re.match(section_pattern, line)
-            if section_match:
-                current_section = section_match.group(1)
-                sections[line_number] = current_section
-
-        # Process each question block
+        question_blocks = []
+        current_block = None
+
+        def flush_block():
+            if current_block is not None:
+                block_section, block_lines = current_block
+                while block_lines and not block_lines[-1].strip():
+                    block_lines.pop()
+                if block_lines:
+                    question_blocks.append((block_section, block_lines))
+
+        # A generous buffer keeps large exam banks to a handful of reads
+        # without ever holding the whole file
+        with open(
+            self.exam_file, "r", encoding="utf-8", buffering=128 * 1024
+        ) as file:
+            for line in file:
+                line = line.rstrip("\n")
+                # Branch on the first character before touching a regex:
+                # only '#' can start a heading, only a digit a question
+                first_char = line[:1]
+                if first_char == "#":
+                    section_match = _SECTION_RE.match(line)
+                    if section_match:
+                        # Intern so the many questions of a section share
+                        # one string object instead of each holding a copy
+                        current_section = sys.intern(section_match.group(1))
+                    if line.startswith("##"):
+                        flush_block()
+                        current_block = None
+                    elif current_block is not None:
+                        current_block[1].append(line)
+                elif first_char.isdigit() and _QUESTION_RE.match(line):
+                    flush_block()
+                    current_block = (current_section, [line])
+                elif current_block is not None:
+                    current_block[1].append(line)
+            flush_block()
+
+        # Process each question block, detecting duplicates as they are
+        # inserted: seen maps dedup key -> index of the first occurrence
         self.questions = []
-        question_key_map = defaultdict(list)
+        self.unique_questions = []
+        seen = {}
 
-        for block in question_blocks:
-            lines = block.strip().split("\n")
+        for section, lines in question_blocks:
             if not lines or len(lines) < 2:
                 continue
 
-            is_ai = "[AI-Generated]" in lines[0]
-            question_match = re.match(r"\d+\.\s+(.*)", lines[0])
+            # The tag sits near the start of the question line, so bound
+            # the scan instead of searching the whole (possibly long) text
+            is_ai = lines[0].find("[AI-Generated]", 0, 200) != -1
+            question_match = _QUESTION_RE.match(lines[0])
             if not question_match:
                 continue
 
             question_text = question_match.group(1).strip()
             options = []
 
-            # Extract valid answer count from comments
+            # Extract valid answer count from comments; the substring test
+            # skips the regex engine on the vast majority of lines
             valid_answers = 1
             for line in lines:
-                valid_match = re.search(r"<!--\s*valid:\s*(\d+)\s*-->", line)
+                if "valid:" not in line:
+                    continue
+                valid_match = _VALID_RE.search(line)
                 if valid_match:
                     valid_answers = int(valid_match.group(1))
                     break
@@ -319,86 +565,74 @@ class ExamSimulator:
             # Extract answer options
             option_lines = []
             for line in lines[1:]:
-                if re.match(r"^\s*\d+\.\s+", line):
-                    option_text = re.sub(r"^\s*\d+\.\s+", "", line)
-                    if option_text.strip():
-                        option_lines.append(option_text.strip())
+                option_match = _OPTION_LINE_RE.match(line)
+                if option_match:
+                    option_text = line[option_match.end():].strip()
+                    if option_text:
+                        option_lines.append(option_text)
 
             if option_lines:
                 options = option_lines
 
-                # Determine question's source section
-                line_num = content.count("\n", 0, content.find(block))
-                section = current_section
-                for sec_line, sec_name in sorted(sections.items(), reverse=True):
-                    if sec_line <= line_num:
-                        section = sec_name
-                        break
-
                 # Create question data structure
-                question_data = {
-                    "question": question_text,
-                    "options": options,
-                    "correct_answer": 0,
-                    "valid_answers": valid_answers,
-                    "is_ai": is_ai,
-                    "source_exam": section,
-                }
+                question_data = Question(
+                    question_text, options, valid_answers, is_ai, section
+                )
 
                 question_key = self.compute_question_key(question_data)
-                question_data["key"] = question_key
+                question_data.key = question_key
 
                 self.questions.append(question_data)
-                question_key_map[question_key].append(len(self.questions) - 1)
-
-        # Process duplicates and create unique question list
-        for question_key, indices in question_key_map.items():
-            if len(indices) > 1:
-                base_question = self.questions[indices[0]]
-                sources = [self.questions[i]["source_exam"] for i in indices]
-                base_question["duplicate_count"] = len(indices)
-                base_question["duplicate_sources"] = sources
-                self.unique_questions.append(indices[0])
-            else:
-                self.questions[indices[0]]["duplicate_count"] = 1
-                self.questions[indices[0]]["duplicate_sources"] = [
-                    self.questions[indices[0]]["source_exam"]
-                ]
-                self.unique_questions.append(indices[0])
-
-        # Validate loaded questions
-        if not self.questions:
-            messagebox.showerror(
-                "Error",
-                f"No valid questions found in {self.exam_file}. Please check the file format.",
-            )
-            return
+                first_index = seen.get(question_key)
+                if first_index is None:
+                    seen[question_key] = len(self.questions) - 1
+                    self.unique_questions.append(len(self.questions) - 1)
+                else:
+                    base_question = self.questions[first_index]
+                    base_question.duplicate_count += 1
+                    base_question.duplicate_sources.append(section)
+
+    def finish_loading(self):
+        """Build the derived lookup data and report the loading summary."""
+        # Cache totals used by the score display so interactive callbacks
+        # don't rescan the whole question list
+        self.total_count = len(self.questions)
+        self.non_ai_total = sum(1 for q in self.questions if not q.is_ai)
+
+        # Flat AI-flag array so filtering scans a compact byte array
+        # instead of chasing one object per question
+        self.is_ai_flags = array("b", (q.is_ai for q in self.questions))
+
+        # Memoize both filter results so toggling the checkboxes doesn't
+        # rebuild the index lists every time
+        self.all_indices = self.unique_questions
+        self.non_ai_indices = [
+            i for i in self.unique_questions if not self.is_ai_flags[i]
+        ]
 
-        # Display loading summary
+        # Build the loading summary and duplicate report, then emit them
+        # with a single write instead of one locked print per duplicate
         total_questions = len(self.questions)
         unique_questions = len(self.unique_questions)
-        print(
+        report = [
             f"Loaded {total_questions} total questions "
             f"({unique_questions} unique) from the exam file."
-        )
-
-        # Report duplicate questions found
-        duplicates_found = sum(
-            1
-            for idx in self.unique_questions
-            if self.questions[idx]["duplicate_count"] > 1
-        )
-        print(f"Found {duplicates_found} questions with duplicates:")
+        ]
 
+        duplicate_lines = []
         for idx in self.unique_questions:
             question = self.questions[idx]
-            if question["duplicate_count"] > 1:
-                print(
-                    f"- '{question['question'][:50]}...' appears {question['duplicate_count']}"
-                    f" times in: {', '.join(question['duplicate_sources'])}"
+            if question.duplicate_count > 1:
+                duplicate_lines.append(
+                    f"- '{question.question[:50]}...' appears {question.duplicate_count}"
+                    f" times in: {', '.join(question.duplicate_sources)}"
                 )
+        report.append(f"Found {len(duplicate_lines)} questions with duplicates:")
+        report.extend(duplicate_lines)
+        sys.stdout.write("\n".join(report) + "\n")
 
         self.initialize_question_order()
+        self.shuffle_option_orders()
         self.update_status()
 
     def toggle_randomize(self):
@@ -450,50 +684,57 @@ class ExamSimulator:
         self.current_question_index = 0
         self.score = 0
         self.questions_answered = 0
+        self.shuffle_option_orders()
         self.show_question()
 
     def initialize_question_order(self):
         """Set up the question sequence based on current filtering settings."""
-        # Start with unique questions only
-        base_indices = self.unique_questions
-
-        # Apply AI filter if enabled
-        filtered = [
-            i
-            for i in base_indices
-            if not (self.non_ai_var.get() and self.questions[i].get("is_ai"))
-        ]
+        # Pick the precomputed filter result for the current AI setting
+        if self.non_ai_var.get():
+            base_indices = self.non_ai_indices
+        else:
+            base_indices = self.all_indices
 
         # Apply randomization if enabled
         if self.randomized:
-            self.question_order = filtered.copy()
-            random.shuffle(self.question_order)
+            self.question_order = random.sample(base_indices, len(base_indices))
         else:
-            self.question_order = filtered
+            self.question_order = base_indices
+
+    def shuffle_option_orders(self):
+        """Draw a fresh option permutation for every question in the order.
+
+        The permutations are cached so redraws (theme toggle, window
+        resize) don't reorder the answers mid-question; each new quiz
+        attempt calls this again to reshuffle. Questions with a single
+        option skip the RNG entirely.
+        """
+        questions = self.questions
+        self.option_orders = {}
+        for i in self.question_order:
+            option_count = len(questions[i].options)
+            if option_count <= 1:
+                self.option_orders[i] = list(range(option_count))
+            else:
+                self.option_orders[i] = random.sample(
+                    range(option_count), option_count
+                )
 
     def get_current_question(self):
-        """Get the current question data based on ordering and index."""
-        if not self.questions or not self.question_order:
-            return None
-
-        actual_index = self.question_order[self.current_question_index]
-        return self.questions[actual_index]
+        """Get the current question data, resolved when the index changes."""
+        return self.current_question
 
     def update_status(self):
         """Update the status bar with current score and question progress."""
         question_count = len(self.question_order)
+        non_ai_only = self.non_ai_var.get()
 
-        if self.non_ai_var.get():
-            status_text = (
-                f"Score: {self.score}/{self.questions_answered} | "
-                f"Question {self.current_question_index + 1} of {question_count} "
-                f"(Non-AI only)"
-            )
-        else:
-            status_text = (
-                f"Score: {self.score}/{self.questions_answered} | "
-                f"Question {self.current_question_index + 1} of {question_count}"
-            )
+        status_text = (
+            f"Score: {self.score}/{self.questions_answered} | "
+            f"Question {self.current_question_index + 1} of {question_count}"
+        )
+        if non_ai_only:
+            status_text += " (Non-AI only)"
 
         if self.randomized:
             status_text += " (Randomized)"
@@ -502,77 +743,90 @@ class ExamSimulator:
 
     def show_question(self):
         """Display the current question and its answer options in the UI."""
-        # Clear previous question UI
-        for widget in self.answer_frame.winfo_children():
-            widget.destroy()
         self.root.unbind("<Button-1>")
         self.answer_widgets = []
         self.result_shown = False
-        if not self.questions:
+        if not self.questions or not self.question_order:
+            # Leave nothing clickable: hide the pooled rows and drop the
+            # previous question's flags so a stale click can't score
+            self.current_question = None
+            self.valid_display_flags = []
+            self.question_text.config(text="")
+            for frame, _radio, _icon in self.row_pool:
+                frame.grid_remove()
             return
-        question_data = self.get_current_question()
-        clean_question = re.sub(r"<!--.*?-->", "", question_data["question"]).strip()
+
+        # Resolve the order indirection once; every other callback reads
+        # the cached question through get_current_question
+        actual_index = self.question_order[self.current_question_index]
+        question_data = self.current_question = self.questions[actual_index]
+        clean_question = question_data.clean_question
 
         # Format question text with numbering
         question_prefix = f"Q{self.current_question_index + 1}: "
         question_text = f"{question_prefix}{clean_question}"
 
-        if question_data.get("duplicate_count", 1) > 1:
-            section_info = f" [{', '.join(question_data['duplicate_sources'])}]"
+        if question_data.duplicate_count > 1:
+            section_info = f" [{', '.join(question_data.duplicate_sources)}]"
         else:
-            section_info = f" [{question_data['source_exam']}]"
+            section_info = f" [{question_data.source_exam}]"
 
         self.question_text.config(text=f"{question_text}{section_info}")
 
-        # Create answer options container
-        options_frame = ttk.Frame(self.answer_frame)
-        options_frame.pack(fill=tk.BOTH, expand=True, anchor="w")
-        options_frame.columnconfigure(0, weight=1)
         self.selected_answer.set("")
-        options = list(enumerate(question_data["options"]))
-        random.shuffle(options)
-        self.shuffled_option_indices = [i for i, _ in options]
-        colors = self.get_current_colors()
-
-        # Create radio buttons for each answer option
-        for display_idx, (_orig_idx, option) in enumerate(options):
-            frame = tk.Frame(options_frame, bg=colors["bg"])
-            frame.grid(row=display_idx, column=0, sticky="ew", pady=5)
-            frame.grid_columnconfigure(0, weight=1)
-
-            radio = tk.Radiobutton(
-                frame,
-                text=option,
-                variable=self.selected_answer,
-                value=str(display_idx),
-                command=self.on_radio_selected,
-                wraplength=self.window_width - 240,
-                anchor="nw",
-                justify="left",
-                bg=colors["bg"],
-                fg=colors["fg"],
-                selectcolor=colors["fg"],
-                font=("Arial", 12),
-                highlightthickness=0,
-                bd=0,
-                activebackground=colors["bg"],
-                activeforeground=colors["fg"],
-            )
-            radio.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
+        self.shuffled_option_indices = self.option_orders[actual_index]
 
-            # Icon label for showing correct/incorrect status
-            icon_label = tk.Label(
-                frame,
-                text="",
-                bg=colors["bg"],
-                font=("Arial", 32),
-                width=2,
-                anchor="n",
+        # Resolve which display rows hold correct answers now, so the
+        # answer click only has to index a flag list
+        valid_count = question_data.valid_answers
+        self.valid_display_flags = [
+            orig_idx < valid_count for orig_idx in self.shuffled_option_indices
+        ]
+        colors = self.colors
+
+        # Grow the row pool if this question has more options than any
+        # previous one, then reconfigure the rows in place
+        option_count = len(self.shuffled_option_indices)
+        while len(self.row_pool) < option_count:
+            self.row_pool.append(self.create_answer_row(len(self.row_pool)))
+
+        # Hoist loop invariants to locals; self.* lookups are dict hits
+        # on every iteration
+        bg = colors["bg"]
+        fg = colors["fg"]
+        wrap = self.window_width - 240
+        options = question_data.options
+        row_pool = self.row_pool
+
+        # The active rows alias the pool entries, so a lazily created
+        # icon label is visible through both
+        self.answer_widgets = row_pool[:option_count]
+
+        for display_idx, orig_idx in enumerate(self.shuffled_option_indices):
+            frame, radio, icon_label = row_pool[display_idx]
+            radio.config(
+                text=options[orig_idx],
+                state=tk.NORMAL,
+                wraplength=wrap,
+                bg=bg,
+                fg=fg,
+                selectcolor=fg,
+                activebackground=bg,
+                activeforeground=fg,
             )
-            icon_label.grid(row=0, column=1, sticky="ne", padx=(0, 10), pady=10)
-            self.answer_widgets.append((radio, icon_label))
+            frame.config(bg=bg)
+            if icon_label is not None:
+                icon_label.config(text="", bg=bg)
+            frame.grid()
+
+        # Hide rows beyond this question's option count
+        for frame, _radio, _icon in row_pool[option_count:]:
+            frame.grid_remove()
         self.update_status()
 
+        # Flush the batched widget changes in one layout pass
+        self.root.update_idletasks()
+
     def on_radio_selected(self):
         """Handle the selection of an answer option."""
         if self.result_shown:
@@ -583,25 +837,22 @@ class ExamSimulator:
 
     def show_result(self, display_index):
         """Show the result of the selected answer and provide feedback."""
-        colors = self.get_current_colors()
-        question_data = self.get_current_question()
-        valid_answers_count = question_data.get("valid_answers", 1)
-        selected_option_index = self.shuffled_option_indices[display_index]
-        is_correct = selected_option_index < valid_answers_count
+        colors = self.colors
+        valid_flags = self.valid_display_flags
+        is_correct = valid_flags[display_index]
 
         # Disable all radio buttons after selection
-        for radio, _ in self.answer_widgets:
+        for _frame, radio, _icon in self.answer_widgets:
             radio.config(state=tk.DISABLED)
 
-        # Show correct/incorrect icons
-        for i, (radio, icon_label) in enumerate(self.answer_widgets):
-            orig_idx = self.shuffled_option_indices[i]
-            if orig_idx < valid_answers_count:
-                icon_label.config(text="✓", fg=colors["success"])
+        # Show correct/incorrect icons, creating them only where needed
+        for i, row in enumerate(self.answer_widgets):
+            if valid_flags[i]:
+                self.ensure_icon_label(i).config(text="✓", fg=colors["success"])
             elif i == display_index:
-                icon_label.config(text="×", fg=colors["error"])
-            else:
-                icon_label.config(text="")
+                self.ensure_icon_label(i).config(text="×", fg=colors["error"])
+            elif row[2] is not None:
+                row[2].config(text="")
 
         # Update score if correct
         if is_correct:
@@ -620,26 +871,48 @@ class ExamSimulator:
         else:
             # Calculate final score based on current filter
             if self.non_ai_var.get():
-                total = sum(1 for q in self.questions if not q.get("is_ai"))
+                total = self.non_ai_total
             else:
-                total = len(self.questions)
+                total = self.total_count
             self.status_label.config(text=f"End | Final score: {self.score}/{total}")
-            for radio, _ in getattr(self, "answer_widgets", []):
+            for _frame, radio, _icon in getattr(self, "answer_widgets", []):
                 radio.config(state=tk.DISABLED)
 
     def on_window_resize(self, event):
-        """Adjust UI elements when the window is resized."""
+        """Schedule a debounced layout update when the window is resized."""
         if event.widget != self.root:
             return
-        self.window_width = event.width
-        self.window_height = event.height
-        self.question_text.config(wraplength=self.window_width - 80)
-        for radio, _ in getattr(self, "answer_widgets", []):
-            radio.config(wraplength=self.window_width - 240)
+        # <Configure> also fires for moves and focus changes with the size
+        # unchanged; skip those outright
+        if (
+            event.width == self.window_width
+            and event.height == self.window_height
+            and self.resize_after_id is None
+        ):
+            return
+        # <Configure> fires continuously while dragging; only reflow once
+        # the size has settled for a moment
+        if self.resize_after_id is not None:
+            self.root.after_cancel(self.resize_after_id)
+        self.resize_after_id = self.root.after(
+            50, self.apply_resize, event.width, event.height
+        )
+
+    def apply_resize(self, width, height):
+        """Adjust UI elements for the new window size."""
+        self.resize_after_id = None
+        self.window_width = width
+        self.window_height = height
+        self.question_text.config(wraplength=width - 80)
+        for _frame, radio, _icon in getattr(self, "answer_widgets", []):
+            radio.config(wraplength=width - 240)
+        self.root.update_idletasks()
 
 
 def main():
     """Main entry point for the Exam Simulator application."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="Exam Simulator")
     parser.add_argument("-p", "--path", type=str, help="Path to the exam file")
     args = parser.parse_args()
@@ -648,25 +921,37 @@ def main():
 
     # Auto-detect exam file if not specified
     if not exam_file:
-        current_dir_files = [
-            f for f in os.listdir() if f.endswith(".md") and f.lower() != "readme.md"
-        ]
-        if current_dir_files:
-            exam_file = current_dir_files[0]
-            print(f"No path specified. Using file: {exam_file}")
-        else:
+        # Stop scanning at the first matching file instead of listing
+        # the whole directory
+        with os.scandir() as entries:
+            exam_file = next(
+                (
+                    entry.name
+                    for entry in entries
+                    if entry.is_file()
+                    and entry.name.endswith(".md")
+                    and entry.name.lower() != "readme.md"
+                ),
+                None,
+            )
+        if exam_file is None and os.path.isdir("exams"):
             # Check exams subdirectory
-            if os.path.exists("exams") and os.path.isdir("exams"):
-                exam_dir_files = [
-                    os.path.join("exams", f)
-                    for f in os.listdir("exams")
-                    if f.endswith(".md") and f.lower() != "readme.md"
-                ]
-                if exam_dir_files:
-                    exam_file = exam_dir_files[0]
-                    print(f"No path specified. Using file: {exam_file}")
+            with os.scandir("exams") as entries:
+                exam_file = next(
+                    (
+                        os.path.join("exams", entry.name)
+                        for entry in entries
+                        if entry.is_file()
+                        and entry.name.endswith(".md")
+                        and entry.name.lower() != "readme.md"
+                    ),
+                    None,
+                )
+        if exam_file:
+            print(f"No path specified. Using file: {exam_file}")
 
     # Launch application
+    load_tkinter()
     root = tk.Tk()
     ExamSimulator(root, exam_file=exam_file)
     root.mainloop()